@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import math
+import sys
 from collections.abc import Iterable
 
 import pandas as pd
@@ -129,6 +130,11 @@ def _format_object(self, obj: dict, exclude: Iterable | None = None):
                 if obj.get(key) is None:
                     obj[key] = pd.NA
 
+        # intern repeated categorical strings
+        for key in ["area_code", "source"]:
+            if isinstance(obj.get(key), str):
+                obj[key] = sys.intern(obj[key])
+
         # reduce items in scenario
         return {k: v for k, v in obj.items() if k not in exclude}
 
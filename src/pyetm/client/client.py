@@ -1,5 +1,6 @@
 """client object"""
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterable
 
 import pandas as pd
@@ -7,6 +8,7 @@
 from pyetm.logger import get_modulelogger
 from pyetm.sessions import AIOHTTPSession, RequestsSession
 from pyetm.types import InterpolateOptions
+from pyetm.utils.general import get_max_workers
 from pyetm.utils.interpolation import interpolate
 
 from .account import AccountMethods
@@ -245,17 +247,29 @@ def from_interpolation(
         client : Client
             Returns initialized client object."""
 
-        # handle scenario ids:
-        if saved_scenario_ids:
-            # Only perform read operations on these sids
-            # as saved scenario's history would otherwise be modified.
-            client = Client(**kwargs)
-            scenario_ids = [client._get_saved_scenario_id(sid) for sid in scenario_ids]
+        # materialize scenario ids
+        scenario_ids = list(scenario_ids)
+        if not scenario_ids:
+            raise ValueError("No scenario ids passed for interpolation")
+
+        # limit number of concurrent requests
+        max_workers = get_max_workers(len(scenario_ids))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # handle scenario ids:
+            if saved_scenario_ids:
+                # Only perform read operations on these sids
+                # as saved scenario's history would otherwise be modified.
+                client = Client(**kwargs)
+                scenario_ids = list(
+                    executor.map(client._get_saved_scenario_id, scenario_ids)
+                )
+
+            # initialize scenario ids concurrently and sort by end year
+            clients = list(
+                executor.map(lambda sid: Client(sid, **kwargs), scenario_ids)
+            )
 
-        clients = [Client(sid, **kwargs) for sid in scenario_ids]
-
-        # initialize scenario ids and sort by end year
-        clients = [Client(sid, **kwargs) for sid in scenario_ids]
         clients = sorted(clients, key=lambda cln: cln.end_year)
 
         # get interpolated input parameters
@@ -391,6 +405,7 @@ def _reset_cache(self):
         # clear parameter caches
         self._get_scenario_header.cache_clear()
         self._get_input_parameters.cache_clear()
+        self._get_merit_order_enabled.cache_clear()
 
         # clear frame caches
         self.get_application_demands.cache_clear()
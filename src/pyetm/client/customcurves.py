@@ -2,9 +2,10 @@
 from __future__ import annotations
 import functools
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Collection, Iterable, Mapping
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from pyetm.logger import get_modulelogger
@@ -140,13 +141,18 @@ def custom_curves(self, ccurves: pd.Series[Any] | pd.DataFrame | None):
             self.delete_custom_curves()
 
     # consider moving validation to endpoint
-    def validate_ccurve_key(self, key: str):
-        """check if key is valid ccurve"""
+    def validate_ccurve_key(self, key: str, valid: Collection[str] | None = None):
+        """check if key is valid ccurve, optionally against
+        a precomputed collection of valid keys"""
+
+        # default to all custom curve keys
+        if valid is None:
+            valid = self.get_custom_curve_keys(
+                include_unattached=True, include_internal=True
+            )
 
         # check if key in ccurve index
-        if str(key) not in self.get_custom_curve_keys(
-            include_unattached=True, include_internal=True
-        ):
+        if str(key) not in valid:
             raise KeyError(f"'{key}' is not a valid custom curve key")
 
     @functools.lru_cache(maxsize=1)
@@ -156,7 +162,7 @@ def get_custom_curves(
         """get custom curve"""
 
         # get all attached keys
-        attached = self.get_custom_curve_keys(False, True)
+        attached = set(self.get_custom_curve_keys(False, True))
 
         # handle single key
         if isinstance(keys, str):
@@ -170,26 +176,25 @@ def get_custom_curves(
         if not keys:
             logger.info("attempting to retrieve custom curves without any attached")
 
-        # warn user
-        for key in set(keys).symmetric_difference(attached):
-            logger.info(
-                "attempting to retrieve '%s' while custom curve not attached", key
-            )
-
-        # get curves
-        curves: list[pd.Series[Any]] = []
-        for key in set(keys).intersection(attached):
-            # validate key
-            self.validate_ccurve_key(key)
+        # get curves, attached keys are known valid
+        curves: dict[str, np.ndarray] = {}
+        for key in set(keys):
+            # warn user
+            if key not in attached:
+                logger.info(
+                    "attempting to retrieve '%s' while custom curve not attached", key
+                )
+                continue
 
             # make request
             url = self.make_endpoint_url(endpoint="custom_curves", extra=key)
             buffer = self.session.get(url, content_type="text/csv")
 
-            # append as series
-            curves.append(pd.read_csv(buffer, header=None, names=[key]).squeeze(axis=1))
+            # collect values as array
+            curves[key] = pd.read_csv(buffer, header=None).iloc[:, 0].to_numpy()
 
-        return pd.concat(curves, axis=1).squeeze(axis=1)
+        # construct frame at once
+        return pd.DataFrame(curves).squeeze(axis=1)
 
     def set_custom_curves(
         self,
@@ -241,11 +246,20 @@ def upload_custom_curves(
             # convert to mapping
             filenames = dict(zip(ccurves.columns, list(filenames)))
 
+        # skip requests without curves
+        if ccurves.columns.empty:
+            return None
+
+        # get valid keys once
+        valid = set(
+            self.get_custom_curve_keys(include_unattached=True, include_internal=True)
+        )
+
         # upload columns sequentually
         for key, curve in ccurves.items():
             # validate key
             key = str(key)
-            self.validate_ccurve_key(key)
+            self.validate_ccurve_key(key, valid=valid)
 
             # check curve length
             if not len(curve) == 8760:
@@ -266,7 +280,7 @@ def delete_custom_curves(self, keys: str | Iterable[str] | None = None) -> None:
         """delete custom curves"""
 
         # get all attached keys
-        attached = self.get_custom_curve_keys(False, True)
+        attached = set(self.get_custom_curve_keys(False, True))
 
         # handle single key
         if isinstance(keys, str):
@@ -280,20 +294,22 @@ def delete_custom_curves(self, keys: str | Iterable[str] | None = None) -> None:
         if not keys:
             logger.info("attempting to unattach custom curves without any attached")
 
-        # warn user
-        for key in set(keys).symmetric_difference(attached):
-            logger.info(
-                "attempting to remove '%s' while custom curve already unattached", key
-            )
-
-        # delete curves
-        for key in set(keys).intersection(attached):
-            # validate key
-            self.validate_ccurve_key(key)
+        # delete curves, attached keys are known valid
+        deleted = False
+        for key in set(keys):
+            # warn user
+            if key not in attached:
+                logger.info(
+                    "attempting to remove '%s' while custom curve already unattached",
+                    key,
+                )
+                continue
 
             # make request
             url = self.make_endpoint_url(endpoint="custom_curves", extra=key)
             self.session.delete(url)
+            deleted = True
 
-        # reset cache
-        self._reset_cache()
+        # reset cache when scenario changed
+        if deleted:
+            self._reset_cache()
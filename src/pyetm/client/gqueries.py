@@ -23,16 +23,17 @@ def gqueries(self, gqueries: Iterable[str] | None) -> None:
         if isinstance(gqueries, str):
             gqueries = [gqueries]
 
+        # copy to detach from caller's list
         if gqueries is not None:
-            if not isinstance(gqueries, list):
-                gqueries = list(gqueries)
+            gqueries = list(gqueries)
+
+        # reset gquery results when gqueries changed
+        if gqueries != getattr(self, "_gqueries", None):
+            self.get_gquery_results.cache_clear()
 
         # set gqueries
         self._gqueries = gqueries
 
-        # reset gquery results
-        self.get_gquery_results.cache_clear()
-
     @property
     def gquery_results(self):
         """returns results for all set gqueries"""
@@ -46,8 +47,8 @@ def gquery_curves(self):
         gqueries = self.gquery_results
         gqueries = gqueries[gqueries.unit == "curve"]
 
-        # subset future column and convert to series
-        gqueries = gqueries.future.apply(pd.Series)
+        # subset future column and convert to frame at once
+        gqueries = pd.DataFrame(gqueries["future"].tolist(), index=gqueries.index)
 
         return gqueries.T
 
@@ -79,6 +80,10 @@ def get_gquery_results(self):
         # raise without scenario id
         self._validate_scenario_id()
 
+        # return empty frame without request
+        if not self.gqueries:
+            return pd.DataFrame(columns=["present", "future", "unit"])
+
         # create gquery request
         data = {"gqueries": self.gqueries}
         url = self.make_endpoint_url(endpoint="scenario_id")
@@ -12,6 +12,13 @@
 logger = get_modulelogger(__name__)
 
 
+def _correct_nulls(rec: dict) -> dict:
+    """null correction in recordings"""
+    return {
+        k: (v if (v != "null") & (v is not None) else np.nan) for k, v in rec.items()
+    }
+
+
 class MeritOrderMethods(SessionMethods):
     """Merit Order Methods"""
 
@@ -63,23 +70,15 @@ def get_participants(self, subset=None):
         if isinstance(subset, str):
             subset = [subset]
 
-        # convert non list-like to list
-        if not isinstance(subset, list):
-            subset = list(subset)
+        # convert to set for type lookups
+        subset = set(subset)
 
         # correct response JSON
         recs = self._get_merit_configuration(False)["participants"]
         recs = [rec for rec in recs if rec.get("type") in subset]
 
-        def correct(rec):
-            """null correction in recordings"""
-            return {
-                k: (v if (v != "null") & (v is not None) else np.nan)
-                for k, v in rec.items()
-            }
-
         # correct records to replace null with None
-        recs = [correct(rec) for rec in recs]
+        recs = [_correct_nulls(rec) for rec in recs]
         frame = pd.DataFrame.from_records(recs, index="key")
         frame = frame.rename_axis(None, axis=0).sort_index()
 
@@ -100,17 +99,9 @@ def get_participant_curves(self):
         recs = response["participants"]
         cmap = {rec["key"]: rec["curve"] for rec in recs if rec["curve"]}
 
-        # extract curves from response
+        # subset curve for each participant key in a single frame
         curves = response["curves"]
-        curves = pd.DataFrame.from_dict(curves)
-
-        def sset_column(key, value):
-            """helper to rename subsetted column"""
-            return pd.Series(curves[value], name=key)
-
-        # subset curve for each partipant key
-        curves = [sset_column(k, v) for k, v in cmap.items()]
-        curves = pd.concat(curves, axis=1)
+        curves = pd.DataFrame({key: curves[value] for key, value in cmap.items()})
 
         return curves.sort_index(axis=1)
 
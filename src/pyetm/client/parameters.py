@@ -38,13 +38,10 @@ def _get_input_parameters(self) -> pd.DataFrame:
         url = self.make_endpoint_url(endpoint="inputs")
         records = self.session.get(url, content_type="application/json")
 
-        # convert records to frame
-        parameters = pd.DataFrame.from_records(records).T
+        # convert records to frame with typed columns
+        parameters = pd.DataFrame.from_dict(records, orient="index")
         parameters = parameters.drop(columns="cache_error", errors="ignore")
 
-        # infer dtypes
-        parameters = parameters.infer_objects()
-
         # add user to column when absent
         if "user" not in parameters.columns:
             parameters.insert(loc=5, column="user", value=np.nan)
@@ -156,8 +153,8 @@ def set_input_parameters(
         _inputs = self.get_input_parameters(user_only=True)
         _inputs = pd.Series("reset", index=_inputs.index, name="user")
 
-        # combine series and upload values
-        inputs.combine_first(_inputs)
+        # combine series and upload values in a single request
+        inputs = inputs.combine_first(_inputs)
         self.upload_input_parameters(inputs)
 
     def upload_input_parameters(
@@ -205,9 +202,10 @@ def heat_network_order(self) -> list[str]:
 
     @heat_network_order.setter
     def heat_network_order(self, order: list[str]):
-        # check items in order
+        # check items in order against current order
+        valid = set(self.heat_network_order)
         for item in order:
-            if item not in self.heat_network_order:
+            if item not in valid:
                 raise ValueError(f"Invalid heat network order item: '{item}'")
 
         # request parameters
@@ -239,9 +237,10 @@ def forecast_storage_order(self) -> list[str]:
 
     @forecast_storage_order.setter
     def forecast_storage_order(self, order: list[str]) -> None:
-        # check items in order
+        # check items in order against current order
+        valid = set(self.forecast_storage_order)
         for item in order:
-            if item not in self.forecast_storage_order:
+            if item not in valid:
                 raise ValueError(f"Invalid forecast storage order item: '{item}'")
 
         # request parameters
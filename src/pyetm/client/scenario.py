@@ -49,8 +49,7 @@ def keep_compatible(self) -> bool | None:
     @keep_compatible.setter
     def keep_compatible(self, boolean: bool):
         # format header and update
-        header = {"keep_compatible": str(bool(boolean)).lower()}
-        self._update_scenario_header(header)
+        self._update_scenario_settings(keep_compatible=bool(boolean))
 
     @property
     def metadata(self) -> dict[str, Any]:
@@ -66,8 +65,7 @@ def metadata(self, metadata: dict[str, Any] | None):
             metadata = {}
 
         # apply update
-        header = {"metadata": dict(metadata)}
-        self._update_scenario_header(header)
+        self._update_scenario_settings(metadata=metadata)
 
     @property
     def owner(self) -> dict | None:
@@ -81,12 +79,8 @@ def private(self) -> bool | None:
 
     @private.setter
     def private(self, boolean: bool):
-        # # validate token permission
-        self._validate_token_permission(scope="scenarios:write")
-
-        # format header and update
-        header = {"private": str(bool(boolean)).lower()}
-        self._update_scenario_header(header)
+        # validate token permission, format header and update
+        self._update_scenario_settings(private=bool(boolean))
 
     @property
     def scaling(self):
@@ -130,6 +124,32 @@ def updated_at(self) -> pd.Timestamp | None:
 
         return datetime
 
+    def _update_scenario_settings(
+        self,
+        metadata: dict[str, Any] | None = None,
+        keep_compatible: bool | None = None,
+        private: bool | None = None,
+    ) -> None:
+        """update passed scenario settings in a single request"""
+
+        # collect settings in single header
+        header: dict[str, Any] = {}
+
+        if metadata is not None:
+            header["metadata"] = dict(metadata)
+
+        if keep_compatible is not None:
+            header["keep_compatible"] = str(bool(keep_compatible)).lower()
+
+        if private is not None:
+            # validate token permission
+            self._validate_token_permission(scope="scenarios:write")
+            header["private"] = str(bool(private)).lower()
+
+        # apply update
+        if header:
+            self._update_scenario_header(header)
+
     def add_metadata(self, metadata: dict[str, Any]) -> dict[str, Any]:
         """append metadata"""
 
@@ -194,17 +214,8 @@ def copy_scenario(
         scenario_id = int(scenario["id"])
         self.scenario_id = scenario_id
 
-        # set metadata parmater
-        if metadata is not None:
-            self.metadata = metadata
-
-        # set compatability parameter
-        if keep_compatible is not None:
-            self.keep_compatible = keep_compatible
-
-        # set private parameter
-        if private is not None:
-            self.private = private
+        # set metadata, compatability and private parameters
+        self._update_scenario_settings(metadata, keep_compatible, private)
 
         # revert to original scenario_id
         if connect is False:
@@ -256,17 +267,8 @@ def create_new_scenario(
         scenario_id = int(scenario["id"])
         self.scenario_id = scenario_id
 
-        # set scenario metadata
-        if metadata is not None:
-            self.metadata = metadata
-
-        # set keep compatible parameter
-        if keep_compatible is not None:
-            self.keep_compatible = keep_compatible
-
-        # should validate permission
-        if private is not None:
-            self.private = private
+        # set metadata, compatability and private parameters
+        self._update_scenario_settings(metadata, keep_compatible, private)
 
         return scenario_id
 
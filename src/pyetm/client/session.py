@@ -1,7 +1,6 @@
 """Base methods and client"""
 from __future__ import annotations
 
-import copy
 import functools
 import os
 import re
@@ -82,7 +81,7 @@ def scenario_id(self) -> int | None:
     @scenario_id.setter
     def scenario_id(self, scenario_id: int | None):
         # store previous scenario id
-        previous = copy.deepcopy(self.scenario_id)
+        previous = self.scenario_id
 
         # try accessing dict
         if isinstance(scenario_id, dict):
@@ -95,12 +94,9 @@ def scenario_id(self, scenario_id: int | None):
         # set new scenario id
         self._scenario_id = scenario_id
 
-        # log changed scenario id
-        if self.scenario_id != previous:
-            logger.debug(f"Updated scenario_id: '{self.scenario_id}'")
-
-        # reset session
-        if self.scenario_id != previous:
+        # log changed scenario id and reset session
+        if scenario_id != previous:
+            logger.debug(f"Updated scenario_id: '{scenario_id}'")
             self._reset_cache()
 
         # validate scenario id
@@ -285,20 +281,28 @@ def _validate_token_permission(self, scope: TokenScope = "public"):
         """validate token permission"""
 
         # raise without token
-        if self.token is None:
+        if self._token is None:
             raise ValueError("No personall access token asssigned")
 
         # check if scope is known
         if scope is None:
             raise ValueError(f"Unknown token scope: '{scope}'")
 
+        # request token info once
+        token = self.token
+
         # validate token scope
-        if scope not in self.token.loc["scope"]:
+        if scope not in token.loc["scope"]:
             raise ValueError(f"Token has no '{scope}' permission.")
 
     @property
     def merit_order_enabled(self) -> bool:
         """see if merit order is enabled"""
+        return self._get_merit_order_enabled()
+
+    @functools.lru_cache(maxsize=1)
+    def _get_merit_order_enabled(self) -> bool:
+        """get merit order setting"""
 
         # target input parameter
         key = "settings_enable_merit_order"
@@ -339,6 +343,7 @@ def _reset_cache(self):
 
         # clear parameter caches
         self._get_scenario_header.cache_clear()
+        self._get_merit_order_enabled.cache_clear()
 
     def _update_scenario_header(self, header: dict):
         """change header of scenario"""
@@ -15,10 +15,10 @@
 import xlsxwriter
 import pandas as pd
 
-from pyetm import Client
 from pyetm.types import Carrier
-from pyetm.utils.general import iterable_to_str
+from pyetm.utils.general import iterable_to_str, DEFAULT_POOL_SIZE
 from pyetm.utils.url import make_myc_url, set_url_parameters
+from pyetm.optional import get_excel_read_engine
 from pyetm.utils.excel import add_frame, add_series
 
 from .pool import ClientPool
@@ -34,7 +34,7 @@ class ExcelSheetMapping(TypedDict):
     parameters: NotRequired[str]
     gqueries: NotRequired[str]
 
-@dataclass
+@dataclass(slots=True)
 class _ExcelSheetMapping:
     """Defaults names for ExcelSheetMapping"""
     scenarios: str = 'scenarios'
@@ -59,7 +59,8 @@ def validate_carrier_sequence(carriers: Carrier | Sequence[Carrier]) -> list[Car
     if errors:
         raise ValueError(f"Unsupported carriers in sequence: {iterable_to_str(errors)}")
 
-    return list(carriers)
+    # drop duplicates while preserving order
+    return list(dict.fromkeys(carriers))
 
 class MYCClient:
     """Multi Year Chart Client"""
@@ -73,8 +74,8 @@ def myc_url(self) -> str:
     def myc_url(self, url: str | None):
 
         if url is None:
-            # check for default engine
-            with Client(**self._kwargs) as client:
+            # check for default engine with pooled client
+            with self.pool.get_client_from_session_id(None) as client:
                 default_engine = client.connected_to_default_engine
 
             # pass default engine myc URL
@@ -106,6 +107,15 @@ def session_ids(self, session_ids: pd.Series):
         keys = ["study", "scenario", "region", "year"]
         session_ids.index.names = keys
 
+        # drop blank cases at once instead of failing per scenario
+        missing = session_ids.isna()
+        if missing.any():
+            logger.warning(
+                "Dropped case(s) without session id: %s",
+                iterable_to_str(session_ids.index[missing]),
+            )
+            session_ids = session_ids[~missing].astype(int)
+
         # set session ids
         self._session_ids = session_ids
 
@@ -169,7 +179,7 @@ def pool(self) -> ClientPool:
     def pool(self, pool: int | ClientPool | None):
 
         # defeault pool
-        pool = pool if pool else 3
+        pool = pool if pool else DEFAULT_POOL_SIZE
         if isinstance(pool, int):
             pool = ClientPool(maxsize=pool, **self._kwargs)
 
@@ -284,16 +294,17 @@ def from_excel(
 
         def read_sheet(
             xlsx: pd.ExcelFile,
+            sheet_names: frozenset[str],
             sheet_name: str,
             required: bool = True,
             **kwargs
         ) -> pd.Series:
             """read list items"""
 
-            if not sheet_name in xlsx.sheet_names:
+            if not sheet_name in sheet_names:
                 if required:
-                    raise ValueError(f"Could not load required sheet '{sheet_name}' from {xlsx.io}")
-                logger.warning("Could not load optional sheet '%s' from '%s'", sheet_name, xlsx.io)
+                    raise ValueError(f"Could not load required sheet '{sheet_name}' from {filepath}")
+                logger.warning("Could not load optional sheet '%s' from '%s'", sheet_name, filepath)
                 return pd.Series(name=sheet_name, dtype=str)
 
             values = pd.read_excel(xlsx, sheet_name, **kwargs).squeeze(axis=1)
@@ -308,18 +319,27 @@ def read_sheet(
         mapping = _ExcelSheetMapping(**sheet_mapping)
 
         # connect to excel file
-        xlsx = pd.ExcelFile(filepath)
+        with pd.ExcelFile(filepath, engine=get_excel_read_engine()) as xlsx:
 
-        with pd.ExcelFile(filepath) as xlsx:
+            # collect sheet names once for lookups
+            sheets = frozenset(xlsx.sheet_names)
 
             # load session ids
             session_ids = read_sheet(
-                xlsx, mapping.scenarios, usecols=list(range(5)), index_col=list(range(4))
+                xlsx,
+                sheets,
+                mapping.scenarios,
+                usecols=list(range(5)),
+                index_col=list(range(4)),
             )
 
             # load parameters and gqueries
-            parameters = read_sheet(xlsx, mapping.parameters, required=False, usecols=[0])
-            gqueries = read_sheet(xlsx, mapping.gqueries, required=False, usecols=[0])
+            parameters = read_sheet(
+                xlsx, sheets, mapping.parameters, required=False, usecols=[0], dtype=str
+            )
+            gqueries = read_sheet(
+                xlsx, sheets, mapping.gqueries, required=False, usecols=[0], dtype=str
+            )
 
         # intialize model
         model = cls(
@@ -332,6 +352,9 @@ def read_sheet(
             **kwargs,
         )
 
+        # keep source file for copying other tabs
+        model._source = filepath
+
         return model
 
     def slice_cases(self, scenarios: ScenarioSlice | None = None) -> pd.Series[int]:
@@ -388,9 +411,9 @@ def set_parameters(
             parameters = parameters.reset_index(level='unit', drop=True)
 
         # ensure dataframe is consistent with session ids
-        errors = [scenarios for scenarios in parameters.columns if scenarios not in self.session_ids.index]
-        if errors:
-            raise KeyError(f"unknown cases in dataframe: '{errors}'")
+        errors = parameters.columns[~parameters.columns.isin(self.session_ids.index)]
+        if not errors.empty:
+            raise KeyError(f"unknown cases in dataframe: '{errors.to_list()}'")
 
         self.pool.set_parameters(scenarios, parameters, **kwargs)
 
@@ -502,11 +525,15 @@ def make_myc_urls(
             )
         )
 
-        # add title and parameters
+        # add title and parameters in a single pass
         if bool(add_title) is True:
-            for idx, url in urls.items():
-                params = {"title": " ".join(map(str, idx))} # pyright: ignore
-                urls.at[idx] = set_url_parameters(url, params=params)
+            urls = pd.Series(
+                [
+                    set_url_parameters(url, params={"title": " ".join(map(str, idx))})
+                    for idx, url in urls.items()
+                ],
+                index=urls.index,
+            )
 
         return pd.Series(urls, name="url").sort_index()
 
@@ -534,12 +561,11 @@ def convert_to_long(
         """transform frame based on selected mode"""
 
         # convert header to foreign key
-        obj = frame.copy(deep=True)
         mapper = dict(zip(self.session_ids.index, pd.RangeIndex(len(self.session_ids))))
+        columns = frame.columns.map(mapper).set_names(['scenario_id'])
 
-        # map header to scenario id
-        obj.columns = obj.columns.map(mapper)
-        obj.columns.names = ['scenario_id']
+        # map header to scenario id, leaves passed frame untouched
+        obj = frame.set_axis(columns, axis=1)
 
         # set reorder order before stacking
         order = [-1, *range(obj.index.nlevels)]
@@ -699,6 +725,7 @@ def to_excel(
         carriers: Carrier | Sequence[Carrier] | None = None,
         exclude: bool = False,
         invert_sign_convention: bool = False,
+        constant_memory: bool = True,
     ) -> None:
         """Export results of model to Excel.
 
@@ -736,7 +763,11 @@ def to_excel(
         invert_sign_convention : bool, default False
             Inverts sign convention where demand is denoted with
             a negative sign. Demand will be denoted with a positve
-            value and supply with a negative value."""
+            value and supply with a negative value.
+        constant_memory : bool, default True
+            Flush each row to disk once it is written, which keeps
+            memory usage bounded for large hourly curve sheets. Disable
+            to use shared strings, which results in smaller files."""
 
         # default carriers
         if carriers is None:
@@ -754,56 +785,74 @@ def to_excel(
             filepath = Path(filepath)
 
         # check filepath
-        if not Path(filepath).parent.exists:
+        if not Path(filepath).parent.exists():
             raise FileNotFoundError(f"Path to file does not exist: '{filepath}'")
 
-        # create workbook
-        workbook = xlsxwriter.Workbook(str(filepath))
-
-        # write parameters
-        if parameters is not False:
-            frame = self.get_parameters(scenarios=scenarios, exclude=exclude)
-            add_frame("PARAMETERS", frame, workbook, index_width=[80, 18], column_width=18)
-
-        # write gqueries
-        if gqueries is not False:
-            frame = self.get_gqueries(scenarios=scenarios)
-            add_frame("GQUERIES", frame, workbook, index_width=[80, 18], column_width=18)
-
-        # write price curves
-        if price_curves is not False:
-            frame = self.get_price_curves(carriers=carriers, scenarios=scenarios)
-
-            # unstack frame
-            frame = frame.unstack(level="carrier")
-            if not isinstance(frame, pd.DataFrame):
-                frame = frame.to_frame()
-
-            add_frame("PRICES", frame, workbook, column_width=18)
-
-        # write carrier curves
-        if carrier_curves is not False:
-            for carrier in carriers:
-                frame = self.get_carrier_curves(
-                    carrier=carrier,
-                    scenarios=scenarios,
-                    invert_sign_convention=invert_sign_convention
-                )
+        # create workbook that is closed on exit,
+        # also when collecting results fails
+        options = {
+            "constant_memory": bool(constant_memory),
+            "nan_inf_to_errors": True,
+            "use_zip64": True,
+        }
+        with xlsxwriter.Workbook(str(filepath), options) as workbook:
+            # write parameters
+            if parameters is not False:
+                frame = self.get_parameters(scenarios=scenarios, exclude=exclude)
+                if not frame.empty:
+                    add_frame(
+                        "PARAMETERS",
+                        frame,
+                        workbook,
+                        index_width=[80, 18],
+                        column_width=18,
+                    )
+
+            # write gqueries
+            if (gqueries is not False) and (self.gqueries is not None):
+                frame = self.get_gqueries(scenarios=scenarios)
+                if not frame.empty:
+                    add_frame(
+                        "GQUERIES",
+                        frame,
+                        workbook,
+                        index_width=[80, 18],
+                        column_width=18,
+                    )
+
+            # write price curves
+            if price_curves is not False:
+                frame = self.get_price_curves(carriers=carriers, scenarios=scenarios)
 
                 # unstack frame
-                frame = frame.unstack(level=("carrier", "curve"))
+                frame = frame.unstack(level="carrier")
                 if not isinstance(frame, pd.DataFrame):
                     frame = frame.to_frame()
 
-                add_frame(carrier.upper(), frame, workbook, column_width=18)
+                add_frame("PRICES", frame, workbook, column_width=18)
+
+            # write carrier curves
+            if carrier_curves is not False:
+                for carrier in carriers:
+                    frame = self.get_carrier_curves(
+                        carrier=carrier,
+                        scenarios=scenarios,
+                        invert_sign_convention=invert_sign_convention
+                    )
+
+                    # unstack frame
+                    frame = frame.unstack(level=("carrier", "curve"))
+                    if not isinstance(frame, pd.DataFrame):
+                        frame = frame.to_frame()
 
-        if myc_urls is not False:
-            series = self.make_myc_urls(scenarios=scenarios)
+                    add_frame(carrier.upper(), frame, workbook, column_width=18)
 
-            if not series.empty:
-                add_series("ETM_URLS", series, workbook, index_width=18, column_width=80)
+            if myc_urls is not False:
+                series = self.make_myc_urls(scenarios=scenarios)
 
-        # write workbook
-        workbook.close()
+                if not series.empty:
+                    add_series(
+                        "ETM_URLS", series, workbook, index_width=18, column_width=80
+                    )
 
         logger.info("exported results to '%s'", filepath)
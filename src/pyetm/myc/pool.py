@@ -9,12 +9,13 @@
 from traceback import format_exception_only
 
 import logging
+import numpy as np
 import pandas as pd
 
 from pyetm import Client
 from pyetm.types import Carrier
 from pyetm.utils.categorisation import assigin_sign_convention
-from pyetm.utils.general import iterable_to_str
+from pyetm.utils.general import iterable_to_str, DEFAULT_POOL_SIZE
 
 logger = logging.getLogger(__name__)
 Scenarios = dict[Hashable, int] | pd.Series
@@ -38,7 +39,8 @@ def validate_carrier_sequence(carriers: Carrier | Iterable[Carrier]) -> list[Car
     if errors:
         raise ValueError(f"Unsupported carriers in sequence: {iterable_to_str(errors)}")
 
-    return list(carriers)
+    # drop duplicates while preserving order
+    return list(dict.fromkeys(carriers))
 
 class PoolTasks:
     """Pool Tasks"""
@@ -148,7 +150,7 @@ def get_price_curves(
                 logger.debug("Excluded export of hourly %s price curves (NotImplemented in ETM).")
         carriers = ['electricity']
 
-        curves = []
+        curves = {}
         for carrier in carriers:
 
             # TODO: Replace with client.get_price_curve(carrier=carrier)
@@ -160,22 +162,18 @@ def get_price_curves(
             with pool.get_client_from_session_id(scenario_id) as client:
                 curve = getattr(client, attr)()
 
-            # reformat index
-            curve = curve.reset_index(drop=True)
-            curves.append(curve.rename(carrier))
+            # collect hourly values
+            curves[carrier] = curve.to_numpy()
 
-        # concat carrier price curves
-        curves = pd.concat(curves, axis=1)
-
-        # stack carriers
-        curves = curves.T.stack()
-        curves.index = curves.index.rename(['carrier', 'hour'])
+        # stack carrier price curves in a single series
+        hours = range(len(next(iter(curves.values()))))
+        index = pd.MultiIndex.from_product(
+            [list(curves), hours], names=['carrier', 'hour']
+        )
 
-        # validate outcome
-        if not isinstance(curves, pd.Series):
-            raise TypeError(f"Expected Series instead of {type(curves)}.")
+        values = np.concatenate(list(curves.values()))
 
-        return curves.rename(scenario_id)
+        return pd.Series(values, index=index, name=scenario_id)
 
     @staticmethod
     def get_carrier_curves(
@@ -203,17 +201,16 @@ def get_carrier_curves(
         if invert_sign_convention is True:
             raise NotImplementedError("Implementation pending")
 
-        # stack curve keys
-        series = curves.T.stack()
-        series.index = series.index.rename(['curve', 'hour'])
-
-        if not isinstance(series, pd.Series):
-            raise TypeError("returned unexpected instance type")
+        # stack curve keys and prepend carrier to index levels
+        index = pd.MultiIndex.from_product(
+            [[carrier], curves.columns, curves.index],
+            names=['carrier', 'curve', 'hour'],
+        )
 
-        # prepend carrier to index levels
-        series = pd.concat([series], keys=[carrier], names=['carrier'])
+        # flatten values in column order
+        values = curves.to_numpy().ravel(order='F')
 
-        return series.rename(scenario_id)
+        return pd.Series(values, index=index, name=scenario_id)
 
     # @staticmethod
     # def get_climate_years(
@@ -282,14 +279,16 @@ def __init__(
     ) -> None:
 
         if maxsize is None:
-            maxsize = len(clients) if clients else 3
+            maxsize = len(clients) if clients else DEFAULT_POOL_SIZE
 
         self.maxsize = maxsize
-        self.clients = clients
 
         if clients is None:
             clients = [Client(**kwargs) for _ in range(maxsize)]
 
+        # keep reference to pooled clients
+        self.clients = clients
+
         self._pool: Queue[Client] = Queue(maxsize=maxsize)
 
         for idx in range(maxsize):
@@ -365,11 +364,16 @@ def call_threaded(
 
         results = {}
         with ThreadPoolExecutor(max_workers=self._pool.maxsize) as executor:
-            futures = {
-                scenario: executor.submit(
-                    func, pool=self, scenario_id=sid, **kwargs
-                ) for scenario, sid in scenarios.items()
-            }
+
+            # submit a single task per unique scenario id
+            submitted = {}
+            futures = {}
+            for scenario, sid in scenarios.items():
+                if sid not in submitted:
+                    submitted[sid] = executor.submit(
+                        func, pool=self, scenario_id=sid, **kwargs
+                    )
+                futures[scenario] = submitted[sid]
 
             # sequential handle of completed futures
             # Reminder: as_completed does not work when futures are cancelled
@@ -457,6 +461,9 @@ def get_gqueries(
         if gqueries is None:
             raise ValueError("No gqueries specified")
 
+        # materialize unique gqueries once for all tasks
+        gqueries = list(dict.fromkeys(gqueries))
+
         return self.call_threaded(
             func=self.tasks.get_gqueries,
             scenarios=scenarios,
@@ -1,7 +1,7 @@
 """Optinal imports"""
 from __future__ import annotations
 
-__all__ = ["import_optional_dependency"]
+__all__ = ["import_optional_dependency", "get_excel_read_engine"]
 
 from importlib import import_module
 from importlib.metadata import metadata, distribution, PackageNotFoundError
@@ -9,6 +9,7 @@
 from typing import Iterable
 
 import re
+import functools
 import itertools
 
 from packaging.requirements import Requirement
@@ -24,6 +25,19 @@ def _get_optional_requirements(
     if isinstance(exclude_extras, str):
         exclude_extras = {exclude_extras}
 
+    # convert to hashable set for cache lookup
+    if exclude_extras is not None:
+        exclude_extras = frozenset(exclude_extras)
+
+    return list(_collect_optional_requirements(distribution_name, exclude_extras))
+
+@functools.lru_cache(maxsize=None)
+def _collect_optional_requirements(
+    distribution_name: str,
+    exclude_extras: frozenset[str] | None = None
+) -> tuple[Requirement, ...]:
+    """cached collection of optional requirements from package metadata"""
+
     # get distribution metadata
     meta = metadata(distribution_name=distribution_name)
 
@@ -37,9 +51,9 @@ def _get_optional_requirements(
 
     # subset all optional requirments
     patterns = [f"extra == ['\"]{extra}['\"]" for extra in extras]
-    reqs = [req for req in reqs if [pat for pat in patterns if re.search(pat, req)]]
+    reqs = [req for req in reqs if any(re.search(pat, req) for pat in patterns)]
 
-    return list(set(Requirement(req.split(';')[0].strip()) for req in reqs))
+    return tuple(set(Requirement(req.split(';')[0].strip()) for req in reqs))
 
 def _yield_reqs_to_install(
     req: Requirement,
@@ -153,3 +167,15 @@ def import_optional_dependency(
     )
 
     raise ImportError(msg)
+
+@functools.lru_cache(maxsize=None)
+def get_excel_read_engine() -> str | None:
+    """excel read engine for pandas, prefers faster
+    calamine reader when installed"""
+
+    try:
+        import_optional_dependency("python_calamine")
+        return "calamine"
+
+    except ImportError:
+        return None
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from pyetm.logger import _PACKAGEPATH_
@@ -77,30 +78,35 @@ def __repr__(self) -> str:
         return f"Buildings(name={self.name})"
 
     def _calculate_heat_demand(
-        self, effective: float, reference: float, slope: float, constant: float
-    ) -> float:
-        """Calculates the required heating demand for the hour.
+        self,
+        effective: pd.Series[float],
+        reference: pd.Series[float],
+        slope: pd.Series[float],
+        constant: pd.Series[float],
+    ) -> np.ndarray:
+        """Calculates the required heating demand for each hour.
 
         Parameters
         ----------
-        reference : float,
+        effective : pd.Series
+            Effective temperatures
+            for each hour.
+        reference : pd.Series,
             Reference temperatures
-            for hour (TST).
-        slope : float
+            for each hour (TST).
+        slope : pd.Series
             Temperature dependent slope
-            for hour (RER).
+            for each hour (RER).
         constant : pd.Series
             Temperature independent constant
-            for hour (TOP)
+            for each hour (TOP)
 
         Return
         ------
-        demand : float
+        demand : np.ndarray
             Required heating demand"""
-        return (
-            (reference - effective) * slope + constant
-            if effective < reference
-            else constant
+        return np.where(
+            effective < reference, (reference - effective) * slope + constant, constant
         )
 
     def _make_parameters(self, effective: pd.Series[float]) -> pd.DataFrame:
@@ -185,12 +191,12 @@ def make_heat_demand_profile(
         # make parameters
         profiles = self._make_parameters(effective)
 
-        # apply calculate demand functon
-        profile = profiles.apply(lambda row: self._calculate_heat_demand(**row), axis=1)
+        # calculate demand for all hours at once
+        profile = self._calculate_heat_demand(**profiles)
 
         # name profile
         name = "weather/buildings_heating"
-        profile = pd.Series(profile, name=name, dtype=float)
+        profile = pd.Series(profile, profiles.index, name=name, dtype=float)
 
         # scale profile values
         profile = profile / profile.sum() / 3.6e3
@@ -67,11 +67,8 @@ def make_cooling_profile(
 
         # construct mask for daily threshold
         # daily average temperature exceeds daily threshold value
-        daily = temperature.groupby(pd.Grouper(freq="1D"), group_keys=False).apply(
-            lambda group: pd.Series(
-                group.mean() > self.daily_threshold, index=group.index
-            )
-        )
+        daily = temperature.groupby(pd.Grouper(freq="1D")).transform("mean")
+        daily = daily > self.daily_threshold
 
         # construct mask for hourly threshold
         # hourly temperature exceeds hourly threshold value
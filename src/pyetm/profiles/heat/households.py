@@ -5,6 +5,7 @@
 
 from collections.abc import Iterable
 
+import numpy as np
 import pandas as pd
 
 from pyetm.logger import _PACKAGEPATH_
@@ -246,8 +247,14 @@ def make_heat_demand_profile(
         merged = pd.concat([temperature, irradiance], axis=1)
         merged["hour"] = make_period_index(2019, periods=8760).hour
 
-        # apply calculate demand function
-        profile = merged.apply(lambda row: self._calculate_heat_demand(**row), axis=1)
+        # calculate demand hour by hour from plain tuples,
+        # as the inside temperature carries over between hours
+        rows = merged.itertuples(index=False, name=None)
+        profile = pd.Series(
+            [self._calculate_heat_demand(*row) for row in rows],
+            index=merged.index,
+            dtype=float,
+        )
 
         # smooth resulting profile
         values = self.smoother.calculate_smoothed_demand(
@@ -351,4 +358,9 @@ def make_heat_demand_profiles(
             for house in self.houses
         ]
 
-        return pd.concat(profiles, axis=1)
+        # profiles share the same index, stack values in a single block
+        return pd.DataFrame(
+            np.column_stack([profile.to_numpy() for profile in profiles]),
+            index=profiles[0].index,
+            columns=[profile.name for profile in profiles],
+        )
@@ -79,19 +79,14 @@ def interpolate(self, arr, steps):
         to allow for smaller intervals than 1
         hour (steps=10 means 6 minute intervals)
         """
-        interpolated_arr = []
-        for index, value in enumerate(arr):
-            start = value
-            if index == len(arr) - 1:
-                stop = arr[0]
-            else:
-                stop = arr[index + 1]
+        # step towards the next value, wrapping around at the end
+        arr = np.asarray(arr, dtype=float)
+        step_size = (np.roll(arr, -1) - arr) / steps
 
-            step_size = (stop - start) / steps
-            for i in range(0, steps):
-                interpolated_arr.append(start + i * step_size)
+        # broadcast intermediate steps for each value
+        interpolated_arr = arr[:, None] + np.arange(steps) * step_size[:, None]
 
-        return interpolated_arr
+        return interpolated_arr.ravel()
 
     def shift_curve(self, arr, num):
         """
@@ -112,13 +107,13 @@ def trim_interpolated(self, arr, steps):
         hour.
         """
         arr = self.shift_curve(arr, self.interpolation_steps // 2)
-        return [sum(arr[i : (i + steps)]) / steps for i in range(0, len(arr), steps)]
+        return arr.reshape(-1, steps).sum(axis=1) / steps
 
     def calculate_smoothed_demand(self, heat_demand, insulation_type):
         """calculate smoothed demand"""
 
-        # start out with list of zeroes
-        cumulative_demand = [0] * len(heat_demand) * self.interpolation_steps
+        # start out with array of zeroes
+        cumulative_demand = np.zeros(len(heat_demand) * self.interpolation_steps)
 
         # generate random numbers
         deviations = self.generate_deviations(
@@ -129,12 +124,12 @@ def calculate_smoothed_demand(self, heat_demand, insulation_type):
         # (i.e. reduce the time interval 1 hour to e.g. 6 minutes)
         interpolated_demand = self.interpolate(heat_demand, self.interpolation_steps)
 
-        # for each random number, shift the demand curve X places forwards or
-        # backwards (depending on the number value) and add it to the
-        # cumulative demand array
-        for num in deviations:
-            demand_list = self.shift_curve(interpolated_demand, num)
-            cumulative_demand = [x + y for x, y in zip(cumulative_demand, demand_list)]
+        # for each unique random number, shift the demand curve X places
+        # forwards or backwards (depending on the number value) and add it
+        # to the cumulative demand array as often as the number was drawn
+        shifts, counts = np.unique(deviations, return_counts=True)
+        for num, count in zip(shifts, counts):
+            cumulative_demand += count * self.shift_curve(interpolated_demand, num)
 
         # Trim the cumulative demand array such that it has 8760 data points again
         # (hourly intervals instead of 6 minute intervals)
@@ -44,14 +44,14 @@ def assigin_sign_convention(
     if pattern is None:
         pattern = "^.*[.]input [(]MW[)]$"
 
-    # validate pattern is present
-    if not any(curves.columns.get_level_values(level=-1).str.match(pattern)):
-        raise KeyError(f"Could not find pattern in hourly curves: '{pattern}'")
-
     # subset relevant columns
     cols = curves.columns.get_level_values(
         level=-1).str.contains(pattern, regex=True)
 
+    # validate pattern is present
+    if not cols.any():
+        raise KeyError(f"Could not find pattern in hourly curves: '{pattern}'")
+
     # invert selected columns
     if invert_sign is True:
         cols = ~cols
@@ -176,13 +176,9 @@ def categorise_curves(
         curves = curves.T.groupby(by=column).sum().T
 
     else:
-        # make mapper for multiindex
+        # align mapping with curves and apply as multiindex
         names = mapping.columns
-        mapper = dict(zip(mapping.index, pd.MultiIndex.from_frame(mapping)))
-
-        # apply mapping to curves
-        midx = curves.columns.to_series().map(mapper)
-        curves.columns = pd.MultiIndex.from_tuples(midx, names=names)
+        curves.columns = pd.MultiIndex.from_frame(mapping.loc[curves.columns])
 
         # aggregate over levels
         curves = curves.T.groupby(level=list(names)).sum().T
@@ -1,6 +1,7 @@
 """conversion methods"""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,7 +11,9 @@
 from pyetm import Client
 from pyetm.logger import get_modulelogger
 from pyetm.myc import MYCClient
+from pyetm.optional import get_excel_read_engine
 from pyetm.utils import add_frame, add_series
+from pyetm.utils.general import get_max_workers
 
 _logger = get_modulelogger(__name__)
 
@@ -29,9 +32,13 @@ def copy_study_session_ids(
     session ids are decoupled from the original study,
     but contain the same values"""
 
+    # default to concurrency of default client pool
+    maxsize = None
+
     # load study session ids from model
     if isinstance(session_ids, MYCClient):
         kwargs = {**session_ids._kwargs, **kwargs}
+        maxsize = session_ids.pool.maxsize
         session_ids = session_ids.session_ids.copy()
 
     # make series-like object
@@ -49,8 +56,12 @@ def scenario_copy(session_id):
 
         return client.scenario_id
 
-    # make copies of session ids
-    session_ids = session_ids.apply(scenario_copy)
+    # make copies of session ids concurrently
+    max_workers = get_max_workers(len(session_ids), maxsize)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        copies = list(executor.map(scenario_copy, session_ids))
+
+    session_ids = pd.Series(copies, index=session_ids.index, name=session_ids.name)
 
     # set study if applicable
     if study is not None:
@@ -70,12 +81,9 @@ def copy_study_configuration(
     """copy study configuration"""
 
     # check filepath
-    if not Path(filepath).parent.exists:
+    if not Path(filepath).parent.exists():
         raise FileNotFoundError(f"Path to file does not exist: '{filepath}'")
 
-    # create workbook
-    workbook = xlsxwriter.Workbook(str(filepath))
-
     # get session ids
     if copy_session_ids:
         # create copies of session ids
@@ -108,50 +116,53 @@ def copy_study_configuration(
                 + "use 'copy_session_ids=True' instead."
             )
 
-    # add sessions and set column width
-    add_series("Sessions", sessions, workbook, column_width=18)
-
-    # add parameters and set column width
-    add_series(
-        "Parameters", model.parameters, workbook, index_width=80, column_width=18
-    )
-
-    # add gqueries and set column width
-    add_series("GQueries", model.gqueries, workbook, index_width=80, column_width=18)
-
-    # add mapping and set column width
-    if model.mapping is not None:
-        add_frame(
-            "Mapping", model.mapping, workbook, index_width=[80, 18], column_width=18
-        )
-
-    # copy other tabs from source
-    if hasattr(model, "_source"):
-        _logger.debug("detected source file")
-
-        """merge together with model to also validate these values
-        before copying them"""
-
-        # link source file
-        xlsx = pd.ExcelFile(model._source)
-
-        # look for interconnectors
-        sheet = "Interconnectors"
-        if sheet in xlsx.sheet_names:
-            # read and write interconnectors
-            interconnectors = pd.read_excel(xlsx, sheet, index_col=0)
-            add_frame(sheet, interconnectors, workbook, column_width=18)
-
-            _logger.debug("> included '%s' in copy", sheet)
-
-        # look for mpi profiles
-        sheet = "MPI Profiles"
-        if sheet in xlsx.sheet_names:
-            # read and write mpi profiles
-            profiles = pd.read_excel(xlsx, sheet)
-            add_frame(sheet, profiles, workbook, index=False, column_width=18)
+    # create workbook that streams rows and is closed on exit
+    options = {"constant_memory": True, "nan_inf_to_errors": True}
+    with xlsxwriter.Workbook(str(filepath), options) as workbook:
+        # add sessions and set column width
+        add_series("Sessions", sessions, workbook, column_width=18)
+
+        # add parameters and set column width
+        if model.parameters is not None:
+            add_series(
+                "Parameters",
+                model.parameters,
+                workbook,
+                index_width=80,
+                column_width=18,
+            )
 
-            _logger.debug("> included '%s' in copy", sheet)
+        # add gqueries and set column width
+        if model.gqueries is not None:
+            add_series(
+                "GQueries", model.gqueries, workbook, index_width=80, column_width=18
+            )
 
-    # write workbook
-    workbook.close()
+        # copy other tabs from source, skip without source file
+        if model._source is not None:
+            _logger.debug("detected source file")
+
+            """merge together with model to also validate these values
+            before copying them"""
+
+            # link source file
+            with pd.ExcelFile(model._source, engine=get_excel_read_engine()) as xlsx:
+                # look for interconnectors
+                sheet = "Interconnectors"
+                if sheet in xlsx.sheet_names:
+                    # read and write interconnectors
+                    interconnectors = pd.read_excel(xlsx, sheet, index_col=0)
+                    add_frame(sheet, interconnectors, workbook, column_width=18)
+
+                    _logger.debug("> included '%s' in copy", sheet)
+
+                # look for mpi profiles
+                sheet = "MPI Profiles"
+                if sheet in xlsx.sheet_names:
+                    # read and write mpi profiles
+                    profiles = pd.read_excel(xlsx, sheet)
+                    add_frame(
+                        sheet, profiles, workbook, index=False, column_width=18
+                    )
+
+                    _logger.debug("> included '%s' in copy", sheet)
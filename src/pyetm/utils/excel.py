@@ -18,8 +18,8 @@ def _handle_nans(
 ) -> Literal[-1, 0]:
     """handle nan values and convert float to numpy.float64"""
 
-    # write NaN as NA
-    if np.isnan(number):
+    # write NaN as NA, math avoids ufunc dispatch per cell
+    if math.isnan(number):
         return worksheet.write_formula(row, col, "=NA()", cell_format, "#N/A")
 
     # set decimal precision
@@ -83,35 +83,50 @@ def _set_index_width(
         worksheet.set_column(0, index.nlevels - 1, index_width)
 
 
-def _write_index(
+def _write_index_names(
     worksheet: Worksheet,
     index: pd.Index | pd.MultiIndex,
-    row_offset: int,
-    index_width: int | list | None = None,
-    column_width: int | list | None = None,
+    row_num: int,
     cell_format: Format | None = None,
 ) -> None:
-    """write index to worksheet"""
-
-    # set index widths
-    _set_index_width(worksheet, index, index_width, column_width)
+    """write index names to worksheet"""
 
     # write index names
     if _has_names(index):
         for idx, level in enumerate(index.names):
-            worksheet.write(row_offset - 1, idx, level, cell_format)
+            worksheet.write(row_num, idx, level, cell_format)
 
-    # write index values
-    if isinstance(index, pd.MultiIndex):
-        # write index values for multiindex
-        for row_num, row_data in enumerate(index.values):
-            for col_num, cell_data in enumerate(row_data):
-                worksheet.write(row_num + row_offset, col_num, cell_data)
 
-    else:
-        # write index values for regular index
-        for row_num, cell_data in enumerate(index.values):
-            worksheet.write(row_num + row_offset, 0, cell_data)
+def _write_rows(
+    worksheet: Worksheet,
+    values: np.ndarray,
+    index: pd.Index | pd.MultiIndex | None,
+    row_offset: int,
+    col_offset: int,
+) -> None:
+    """write index and cell values to worksheet row by row,
+    which keeps rows in order for constant memory mode"""
+
+    # write cell values without index
+    if index is None:
+        for row_num, row_data in enumerate(values):
+            worksheet.write_row(row_num + row_offset, col_offset, row_data)
+
+        return None
+
+    # write index values and cell values
+    multiindex = isinstance(index, pd.MultiIndex)
+    for row_num, (idx, row_data) in enumerate(zip(index.values, values)):
+        # write index values
+        if multiindex:
+            worksheet.write_row(row_num + row_offset, 0, idx)
+        else:
+            worksheet.write(row_num + row_offset, 0, idx)
+
+        # write cell values
+        worksheet.write_row(row_num + row_offset, col_offset, row_data)
+
+    return None
 
 
 def add_frame(
@@ -135,26 +150,30 @@ def add_frame(
     skiprows = frame.columns.nlevels
     skipcolumns = frame.index.nlevels if index else 0
 
-    # write column values
+    # modify offset when index names are specified
     if isinstance(frame.columns, pd.MultiIndex):
-        # modify offset when index names are specified
         if _has_names(frame.index) & (index is True):
             skiprows += 1
 
-        # write column names
-        if index is True:
-            for idx, level in enumerate(frame.columns.names):
-                worksheet.write(idx, skipcolumns - 1, level, cell_format)
-
-        # write colmns values for multiindex
-        for col_num, col_data in enumerate(frame.columns.values):
-            for row_num, cell_data in enumerate(col_data):
-                worksheet.write(row_num, col_num + skipcolumns, cell_data, cell_format)
+    # write column values
+    if isinstance(frame.columns, pd.MultiIndex):
+        # write column names and values for multiindex by row
+        for row_num, level in enumerate(frame.columns.names):
+            # write column name
+            if index is True:
+                worksheet.write(row_num, skipcolumns - 1, level, cell_format)
+
+            # write column values
+            worksheet.write_row(
+                row_num,
+                skipcolumns,
+                frame.columns.get_level_values(row_num),
+                cell_format,
+            )
 
     else:
         # write column values for regular index
-        for col_num, cell_data in enumerate(frame.columns.values):
-            worksheet.write(0, col_num + skipcolumns, cell_data, cell_format)
+        worksheet.write_row(0, skipcolumns, frame.columns.values, cell_format)
 
     # freeze panes with rows and columns
     worksheet.freeze_panes(skiprows, skipcolumns)
@@ -167,21 +186,22 @@ def add_frame(
         column_width=column_width,
     )
 
-    # write cell values in numeric format
-    for row_num, row_data in enumerate(frame.values):
-        for col_num, cell_data in enumerate(row_data):
-            worksheet.write(row_num + skiprows, col_num + skipcolumns, cell_data)
-
-    # write index
+    # include index
     if index is True:
-        _write_index(
-            worksheet=worksheet,
-            index=frame.index,
-            row_offset=skiprows,
-            index_width=index_width,
-            column_width=column_width,
-            cell_format=cell_format,
-        )
+        # set index widths
+        _set_index_width(worksheet, frame.index, index_width, column_width)
+
+        # write index names
+        _write_index_names(worksheet, frame.index, skiprows - 1, cell_format)
+
+    # write index and cell values
+    _write_rows(
+        worksheet=worksheet,
+        values=frame.values,
+        index=frame.index if index else None,
+        row_offset=skiprows,
+        col_offset=skipcolumns,
+    )
 
     return worksheet
 
@@ -216,19 +236,21 @@ def add_series(
     worksheet.write(0, skipcolumns, header, cell_format)
     worksheet.set_column(skipcolumns, skipcolumns, column_width)
 
-    # write cell values
-    for row_num, cell_data in enumerate(series.values):
-        worksheet.write(row_num + 1, skipcolumns, cell_data)
-
     # include index
     if index is True:
-        _write_index(
-            worksheet=worksheet,
-            index=series.index,
-            row_offset=1,
-            index_width=index_width,
-            column_width=column_width,
-            cell_format=cell_format,
-        )
+        # set index widths
+        _set_index_width(worksheet, series.index, index_width, column_width)
+
+        # write index names
+        _write_index_names(worksheet, series.index, 0, cell_format)
+
+    # write index and cell values
+    _write_rows(
+        worksheet=worksheet,
+        values=series.to_numpy().reshape(-1, 1),
+        index=series.index if index else None,
+        row_offset=1,
+        col_offset=skipcolumns,
+    )
 
     return worksheet
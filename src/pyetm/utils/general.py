@@ -4,6 +4,20 @@
 import re
 from typing import Any, Iterable, Mapping
 
+# default number of clients used concurrently
+DEFAULT_POOL_SIZE = 3
+
+
+def get_max_workers(tasks: int, maxsize: int | None = None) -> int:
+    """number of worker threads for concurrent requests,
+    bounded by the (default) client pool size"""
+
+    # default pool size
+    if maxsize is None:
+        maxsize = DEFAULT_POOL_SIZE
+
+    return max(1, min(tasks, maxsize))
+
 
 def bool_to_json(boolean: bool):
     """convert boolean to json compatible string"""
@@ -1,6 +1,7 @@
 """scenario interpolation"""
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, TYPE_CHECKING
 
 # import os
@@ -8,6 +9,7 @@
 
 import pandas as pd
 from pyetm.types import ErrorHandling, InterpolateOptions
+from pyetm.utils.general import get_max_workers
 
 # from pyetm import Client
 
@@ -113,17 +115,22 @@ def interpolate(
         raise ValueError(f"Duplicate end years in passed clients: {years}")
 
     # filter list
-    filtered = [yr for yr in target if min(years) < yr < max(years)]
+    first, last = min(years), max(years)
+    filtered = [yr for yr in target if first < yr < last]
     if len(set(filtered)) != len(set(target)):
         raise ValueError(
             "Interpolation target(s) out of bound: "
-            f"{min(years)} < "
+            f"{first} < "
             f"{list(set(filtered).symmetric_difference(target))} "
-            f"< {max(years)}."
+            f"< {last}."
         )
 
+    # fetch input parameters of clients concurrently
+    with ThreadPoolExecutor(max_workers=get_max_workers(len(_clients))) as executor:
+        parameters = list(executor.map(lambda cln: cln.input_parameters, _clients))
+
     # merge inputs and mask get input parameters
-    inputs = pd.concat([cln.input_parameters for cln in _clients], axis=1, keys=years)
+    inputs = pd.concat(parameters, axis=1, keys=years)
     params = _clients[0].get_input_parameters(include_disabled=False, detailed=True)
 
     # split input parameters by value type